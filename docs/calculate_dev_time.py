@@ -5,39 +5,246 @@ Development Time Analysis Script
 Analyzes git commit history to estimate development time using a configurable gap threshold.
 
 Usage:
-    python3 calculate_dev_time.py [gap_hours]
+    python3 calculate_dev_time.py [gap_hours] [--since DATE] [--until DATE]
+                                  [--max-count N] [--refs REF [REF ...] | --all]
 
 Arguments:
     gap_hours: Session gap threshold in hours (default: 1.0)
                If time between commits > gap_hours, a new session starts
 
+Options:
+    --since DATE    Only analyze commits more recent than DATE (passed to git log)
+    --until DATE    Only analyze commits older than DATE (passed to git log)
+    --max-count N   Only analyze the N most recent commits
+    --refs REF...   Refs whose history is analyzed (default: HEAD)
+    --all           Analyze every ref, including unmerged branches, tags and
+                    stashes. Slower, since git has to walk all of their history.
+    --no-cache      Ignore the timestamp cache kept in .git/dev_time_cache/
+
 Example:
     python3 calculate_dev_time.py        # Uses 1-hour threshold
     python3 calculate_dev_time.py 3.0    # Uses 3-hour threshold
+    python3 calculate_dev_time.py --since "3 months ago" --refs main develop
 """
 
-from datetime import datetime
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+import argparse
+import hashlib
+import heapq
+import os
+import shutil
 import subprocess
 import sys
 
+try:
+    # Optional: read commits in-process via libgit2 instead of parsing `git log`
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# git is launched by absolute path with close_fds=False so subprocess can use
+# os.posix_spawn() instead of fork()+exec(), which avoids duplicating the
+# parent's page tables on every launch. posix_spawn is only used when the
+# executable path has a directory and no preexec_fn, cwd, pass_fds or
+# close_fds=True is given, so don't add those to the git calls below.
+# Keeping parent fds open is safe: Python creates them non-inheritable.
+GIT = shutil.which('git') or 'git'
+
+# Timestamp cache lives inside the git directory so it is never committed
+CACHE_DIR_NAME = 'dev_time_cache'
+CACHE_MAX_ENTRIES = 10
+
+# git log output is parsed in blocks of this many bytes. Once a history is big
+# enough to span this many blocks (~700k commits), the remaining blocks are
+# parsed in worker processes; below that, process startup costs more than it saves.
+PARSE_BLOCK_SIZE = 1 << 20
+PARALLEL_PARSE_MIN_BLOCKS = 8
+
+
+def write_commit_graph():
+    """
+    Write (or refresh) the repository commit-graph file.
+    
+    The commit-graph lets git walk history without parsing every commit object
+    from the packfiles, which makes repeat runs of `git log` much faster. The
+    command is cheap when the graph is already up to date, and any failure is
+    ignored since the graph is only an optimization.
+    """
+    subprocess.run(
+        [GIT, 'commit-graph', 'write', '--reachable'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+        check=False
+    )
+
+
+def to_chronological(timestamps):
+    """
+    Put newest-first timestamps from a history walk into ascending order.
+    
+    git lists commits newest first, so reversing is usually enough and avoids
+    a full sort. Author times can still be out of order (rebased or
+    cherry-picked commits, skewed clocks), so they are sorted if the reversed
+    order isn't monotonic.
+    """
+    timestamps.reverse()
+    if any(later < earlier for earlier, later in zip(timestamps, timestamps[1:])):
+        timestamps = array('q', sorted(timestamps))
+    return timestamps
+
+
+def get_pygit2_timestamps(refs=None, exclude=None):
+    """
+    Fetch commit author timestamps by walking the object database with pygit2.
+    
+    Commits are read directly as objects, avoiding the `git` process and the
+    text round trip through stdout. Mirrors `git log <refs>` (or `git log --all`),
+    leaving out commits reachable from any commit in `exclude`.
+    
+    Returns:
+        Sorted array('q') of commit times in Unix epoch seconds
+    """
+    repo = pygit2.Repository(pygit2.discover_repository(os.getcwd()))
+    walker = repo.walk(None, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME)
+    
+    if refs:
+        for ref in refs:
+            walker.push(repo.revparse_single(ref).peel(pygit2.Commit).id)
+    else:
+        if not repo.head_is_unborn:
+            walker.push(repo.head.target)
+        for name in repo.references:
+            try:
+                walker.push(repo.references[name].peel(pygit2.Commit).id)
+            except (ValueError, pygit2.GitError):
+                # Refs that don't resolve to a commit (e.g. tags of trees)
+                continue
+    
+    for sha in exclude or ():
+        try:
+            walker.hide(repo[sha].peel(pygit2.Commit).id)
+        except (ValueError, pygit2.GitError):
+            continue
+    
+    return to_chronological(array('q', (commit.author.time for commit in walker)))
+
+
+def get_worker_count():
+    """Number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_timestamp_block(block):
+    """Parse a bytes block of newline-separated epoch seconds without decoding it."""
+    return array('q', map(int, block.split()))
+
 
-def get_git_timestamps():
-    """Fetch all commit timestamps from git repository."""
+def read_timestamps(stream):
+    """
+    Parse epoch seconds from a `git log --pretty=format:%at` output stream.
+    
+    Output is read in fixed-size blocks cut at the last newline so no line is
+    split across blocks. Very large histories hand the remaining blocks to a
+    process pool so parsing scales across cores.
+    
+    Returns:
+        Unsorted array('q') of commit times in Unix epoch seconds.
+        Packed int64 storage grows in bulk per block and avoids a boxed
+        Python int per commit.
+    """
+    timestamps = array('q')
+    futures = []
+    executor = None
+    pending = b''
+    blocks_read = 0
     try:
-        result = subprocess.run(
-            ['git', 'log', '--pretty=format:%ai', '--all'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        while True:
+            chunk = stream.read(PARSE_BLOCK_SIZE)
+            if not chunk:
+                break
+            block, _, pending = (pending + chunk).rpartition(b'\n')
+            blocks_read += 1
+            if executor is None and blocks_read >= PARALLEL_PARSE_MIN_BLOCKS:
+                executor = ProcessPoolExecutor(max_workers=get_worker_count())
+            if executor is not None:
+                futures.append(executor.submit(parse_timestamp_block, block))
+            else:
+                timestamps.extend(parse_timestamp_block(block))
         
-        timestamps = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                dt = datetime.strptime(line.strip(), '%Y-%m-%d %H:%M:%S %z')
-                timestamps.append(dt)
+        # Pool results come before the trailing partial line, which is the
+        # last (oldest) entry of the stream, so output order matches input
+        for future in futures:
+            timestamps.extend(future.result())
+        timestamps.extend(parse_timestamp_block(pending))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    return timestamps
+
+
+def get_git_timestamps(since=None, until=None, max_count=None, refs=None, exclude=None):
+    """
+    Fetch commit timestamps from git repository as Unix epoch seconds.
+    
+    Args:
+        since: Only include commits more recent than this date (git date format)
+        until: Only include commits older than this date (git date format)
+        max_count: Maximum number of commits to include
+        refs: Refs whose history is walked; None walks every ref (--all)
+        exclude: Commit SHAs whose history is left out (`git log ... --not <exclude>`)
+    
+    Returns:
+        Sorted array('q') of commit times in Unix epoch seconds
+    """
+    # pygit2 has no equivalent of git's approxidate parsing, so date windows
+    # always go through `git log`. So does --max-count: no revwalk sort order
+    # picks the same N commits as `git log -n`.
+    if pygit2 is not None and not since and not until and max_count is None:
+        try:
+            return get_pygit2_timestamps(refs=refs, exclude=exclude)
+        except (KeyError, ValueError, pygit2.GitError) as e:
+            print(f"pygit2 walk failed ({e}), falling back to git log", file=sys.stderr)
+    
+    try:
+        # %at gives author time as epoch seconds, so each line is a plain int()
+        # instead of a comparatively slow datetime.strptime() call. Output is
+        # streamed in blocks rather than buffered and split in one piece.
+        # Commit limiting is left to git so it can stop walking history early.
+        write_commit_graph()
+        args = [
+            GIT, '-c', 'core.commitGraph=true', '-c', 'gc.writeCommitGraph=true',
+            'log', '--pretty=format:%at'
+        ]
+        if since:
+            args += ['--since', since]
+        if until:
+            args += ['--until', until]
+        if max_count is not None:
+            args += ['-n', str(max_count)]
+        args += refs if refs else ['--all']
+        if exclude:
+            args += ['--not', *exclude]
+        # Skip verifying commit-graph entries against the object database
+        env = dict(os.environ, GIT_COMMIT_GRAPH_PARANOIA='false')
+        # stdout is deliberately left in binary mode (no text=True): int() parses
+        # ASCII digit bytes directly, so the output never goes through a decoder.
+        with subprocess.Popen(
+            args, stdout=subprocess.PIPE, bufsize=PARSE_BLOCK_SIZE, env=env, close_fds=False
+        ) as proc:
+            timestamps = read_timestamps(proc.stdout)
         
-        return sorted(timestamps)
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+        
+        return to_chronological(timestamps)
     except subprocess.CalledProcessError as e:
         print(f"Error running git command: {e}", file=sys.stderr)
         sys.exit(1)
@@ -46,61 +253,223 @@ def get_git_timestamps():
         sys.exit(1)
 
 
+def get_ref_tips(refs=None):
+    """
+    Return the commit SHAs of `refs` (or of HEAD and every ref tip when None),
+    or None if they can't be read.
+    
+    Commit timestamps are a pure function of the commit graph, so these tips
+    fully identify the history a cached result was computed from.
+    """
+    revisions = [f'{ref}^{{commit}}' for ref in refs] if refs else ['HEAD', '--all']
+    try:
+        output = subprocess.check_output(
+            [GIT, 'rev-parse', *revisions], stderr=subprocess.DEVNULL, text=True, close_fds=False
+        )
+    except subprocess.CalledProcessError:
+        return None
+    return sorted(set(output.split()))
+
+
+def get_cache_path(max_count=None, refs=None):
+    """
+    Resolve the timestamp cache file for the given query options.
+    
+    Returns:
+        Path of the cache file, or None if the git directory can't be found
+    """
+    try:
+        git_dir = subprocess.check_output(
+            [GIT, 'rev-parse', '--git-dir'], stderr=subprocess.DEVNULL, text=True, close_fds=False
+        ).strip()
+    except subprocess.CalledProcessError:
+        return None
+    
+    key = hashlib.blake2b(repr((max_count, refs)).encode(), digest_size=16)
+    return Path(git_dir) / CACHE_DIR_NAME / f"{key.hexdigest()}.bin"
+
+
+def load_cache(cache_path):
+    """
+    Load a cache entry.
+    
+    Entries hold one line of space-separated ref tip SHAs followed by the
+    sorted timestamps packed as int64.
+    
+    Returns:
+        Tuple of (ref tips, timestamps), or None on a cache miss
+    """
+    try:
+        header, _, packed = cache_path.read_bytes().partition(b'\n')
+        ref_tips = header.decode().split()
+        timestamps = array('q')
+        timestamps.frombytes(packed)
+    except (OSError, ValueError):
+        return None
+    
+    # Refresh mtime so the entry counts as recently used. A read-only cache
+    # directory still serves the entry; it just isn't marked as fresh.
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return ref_tips, timestamps
+
+
+def save_cache(cache_path, ref_tips, timestamps):
+    """Store a cache entry, keeping only the most recently used entries."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interrupted write never leaves
+        # an entry with valid ref tips but truncated timestamps
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_bytes(' '.join(ref_tips).encode() + b'\n' + array('q', timestamps).tobytes())
+        os.replace(tmp_path, cache_path)
+        
+        entries = sorted(cache_path.parent.glob('*.bin'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in entries[CACHE_MAX_ENTRIES:]:
+            stale.unlink()
+    except OSError as e:
+        print(f"Warning: Could not write timestamp cache: {e}", file=sys.stderr)
+
+
+def is_history_extended(old_tips, refs=None):
+    """
+    Check that every previously cached ref tip is still reachable.
+    
+    If so, the current history is the cached history plus new commits and the
+    cache can be updated incrementally. Rewritten or deleted branches make this
+    false, since their old commits may no longer be part of the history.
+    """
+    try:
+        unreachable = subprocess.check_output(
+            [GIT, 'rev-list', '--count', *old_tips, '--not', *(refs if refs else ['--all'])],
+            stderr=subprocess.DEVNULL,
+            text=True,
+            close_fds=False
+        )
+    except subprocess.CalledProcessError:
+        # Unknown (e.g. garbage collected) commits
+        return False
+    return int(unreachable) == 0
+
+
+def get_cached_git_timestamps(max_count=None, refs=None):
+    """
+    Fetch commit timestamps, reusing and updating the on-disk cache.
+    
+    An unchanged repository is served straight from the cache. When history has
+    only grown since the last run, just the new commits are fetched
+    (`git log ... --not <cached tips>`) and merged into the cached timestamps.
+    Anything else falls back to a full walk.
+    
+    Returns:
+        Sorted array('q') of commit times in Unix epoch seconds
+    """
+    ref_tips = get_ref_tips(refs)
+    cache_path = get_cache_path(max_count=max_count, refs=refs) if ref_tips else None
+    if cache_path is None:
+        return get_git_timestamps(max_count=max_count, refs=refs)
+    
+    cached = load_cache(cache_path)
+    if cached is not None:
+        cached_tips, cached_timestamps = cached
+        if cached_tips == ref_tips:
+            print("Using cached git commit history", file=sys.stderr)
+            return cached_timestamps
+        # A --max-count window slides as commits are added, so it can't be patched
+        if max_count is None and is_history_extended(cached_tips, refs):
+            new_timestamps = get_git_timestamps(refs=refs, exclude=cached_tips)
+            print(f"Updated cached git commit history with {len(new_timestamps)} new commits", file=sys.stderr)
+            timestamps = array('q', heapq.merge(cached_timestamps, new_timestamps))
+            save_cache(cache_path, ref_tips, timestamps)
+            return timestamps
+    
+    timestamps = get_git_timestamps(max_count=max_count, refs=refs)
+    if timestamps:
+        save_cache(cache_path, ref_tips, timestamps)
+    return timestamps
+
+
+def stream_sessions(timestamps, gap_threshold_seconds):
+    """
+    Split chronological timestamps into sessions in a single streaming pass.
+    
+    This is the only per-commit loop in the analysis. Gap detection, boundary
+    tracking and commit counting are fused, so no per-commit intermediates
+    (gap lists, break indices) are built and memory stays O(sessions).
+    Accepts any iterable, including a generator.
+    
+    Yields:
+        (start_ts, end_ts, commits) for each session, in order
+    """
+    iterator = iter(timestamps)
+    for first in iterator:
+        start = end = first
+        commits = 1
+        break
+    else:
+        return
+    
+    for ts in iterator:
+        if ts - end > gap_threshold_seconds:
+            yield start, end, commits
+            start = ts
+            commits = 0
+        end = ts
+        commits += 1
+    yield start, end, commits
+
+
+@dataclass
+class Sessions:
+    """
+    Work sessions stored as parallel columns (structure of arrays).
+    
+    Row `i` of every column describes one session; keeping each field in a
+    packed array avoids a dict per session and lets whole-column operations
+    like sum() run without touching per-session Python objects.
+    """
+    starts: array = field(default_factory=lambda: array('q'))      # epoch seconds
+    ends: array = field(default_factory=lambda: array('q'))        # epoch seconds
+    durations: array = field(default_factory=lambda: array('d'))   # hours
+    commits: array = field(default_factory=lambda: array('q'))
+    
+    def __len__(self):
+        return len(self.starts)
+
+
 def calculate_sessions(timestamps, gap_threshold_hours=1.0):
     """
     Calculate work sessions from commit timestamps.
     
     Args:
-        timestamps: Sorted list of datetime objects
+        timestamps: Chronological iterable of commit times in Unix epoch seconds
         gap_threshold_hours: Maximum gap between commits in same session (hours)
     
     Returns:
-        List of session dictionaries with start, end, duration, and commits
+        Sessions with start/end epoch seconds, duration and commit count columns
     """
-    if not timestamps:
-        return []
-    
-    sessions = []
-    current_session_start = timestamps[0]
-    current_session_end = timestamps[0]
-    current_session_commits = 1
-    
-    for i in range(1, len(timestamps)):
-        gap = (timestamps[i] - timestamps[i-1]).total_seconds() / 3600  # gap in hours
-        
-        if gap <= gap_threshold_hours:
-            # Continue current session
-            current_session_end = timestamps[i]
-            current_session_commits += 1
-        else:
-            # End current session, start new one
-            duration = (current_session_end - current_session_start).total_seconds() / 3600
-            sessions.append({
-                'start': current_session_start,
-                'end': current_session_end,
-                'duration': duration,
-                'commits': current_session_commits
-            })
-            current_session_start = timestamps[i]
-            current_session_end = timestamps[i]
-            current_session_commits = 1
-    
-    # Add final session
-    duration = (current_session_end - current_session_start).total_seconds() / 3600
-    sessions.append({
-        'start': current_session_start,
-        'end': current_session_end,
-        'duration': duration,
-        'commits': current_session_commits
-    })
+    # Gaps are whole seconds, so `gap > hours * 3600` is equivalent to comparing
+    # against the truncated integer threshold, keeping the loop integer-only.
+    gap_threshold_seconds = int(gap_threshold_hours * 3600)
     
+    sessions = Sessions()
+    for start, end, commits in stream_sessions(timestamps, gap_threshold_seconds):
+        sessions.starts.append(start)
+        sessions.ends.append(end)
+        sessions.durations.append((end - start) / 3600.0)
+        sessions.commits.append(commits)
     return sessions
 
 
 def print_analysis(sessions, gap_threshold_hours, total_commits):
     """Print formatted analysis results."""
-    total_hours = sum(s['duration'] for s in sessions)
-    sessions_sorted = sorted(sessions, key=lambda x: x['duration'], reverse=True)
+    durations = sessions.durations
+    total_hours = sum(durations)
+    # Partial sort over row indices: only the 10 longest sessions are displayed.
+    # nlargest is stable, so earlier sessions stay first on ties.
+    longest = heapq.nlargest(10, range(len(sessions)), key=durations.__getitem__)
     
     print("=" * 80)
     print(f"DEVELOPMENT TIME ANALYSIS (Gap Threshold: {gap_threshold_hours} hour{'s' if gap_threshold_hours != 1 else ''})")
@@ -115,13 +484,16 @@ def print_analysis(sessions, gap_threshold_hours, total_commits):
     print(f"{'Rank':<6}{'Date':<15}{'Duration':<12}{'Time Range':<25}{'Commits':<10}")
     print("-" * 80)
     
-    for i, session in enumerate(sessions_sorted[:10], 1):
-        date_str = session['start'].strftime('%b %d, %Y')
-        duration_str = f"{session['duration']:.2f} hrs"
-        start_time = session['start'].strftime('%H:%M')
-        end_time = session['end'].strftime('%H:%M')
+    for i, row in enumerate(longest, 1):
+        # Only the displayed sessions are converted back to datetimes
+        start = datetime.fromtimestamp(sessions.starts[row], tz=timezone.utc)
+        end = datetime.fromtimestamp(sessions.ends[row], tz=timezone.utc)
+        commits = sessions.commits[row]
+        # One strftime call yields both the date and start time columns
+        date_str, start_time = start.strftime('%b %d, %Y|%H:%M').split('|')
+        duration_str = f"{durations[row]:.2f} hrs"
+        end_time = end.strftime('%H:%M')
         time_range = f"{start_time} - {end_time}"
-        commits = session['commits']
         
         print(f"{i:<6}{date_str:<15}{duration_str:<12}{time_range:<25}{commits:<10}")
     
@@ -131,6 +503,7 @@ def print_analysis(sessions, gap_threshold_hours, total_commits):
     print(f"  - If gap between commits ≤ {gap_threshold_hours}h → same session")
     print(f"  - If gap between commits > {gap_threshold_hours}h → new session")
     print("  - Session duration = time from first to last commit")
+    print("  - Session dates and times are shown in UTC")
     print("  - Conservative estimate (excludes research, planning, testing without commits)")
     print("=" * 80)
 
@@ -138,20 +511,43 @@ def print_analysis(sessions, gap_threshold_hours, total_commits):
 def main():
     """Main function to run the analysis."""
     # Parse command line arguments
-    gap_threshold_hours = 1.0  # Default: 1 hour
-    if len(sys.argv) > 1:
-        try:
-            gap_threshold_hours = float(sys.argv[1])
-            if gap_threshold_hours <= 0:
-                print("Error: Gap threshold must be positive", file=sys.stderr)
-                sys.exit(1)
-        except ValueError:
-            print(f"Error: Invalid gap threshold '{sys.argv[1]}'. Must be a number.", file=sys.stderr)
+    parser = argparse.ArgumentParser(description='Estimate development time from git commit history.')
+    parser.add_argument('gap_hours', nargs='?', default='1.0',
+                        help='Session gap threshold in hours (default: 1.0)')
+    parser.add_argument('--since', help='Only analyze commits more recent than this date')
+    parser.add_argument('--until', help='Only analyze commits older than this date')
+    parser.add_argument('--max-count', type=int, help='Only analyze the N most recent commits')
+    ref_group = parser.add_mutually_exclusive_group()
+    ref_group.add_argument('--refs', nargs='+', default=['HEAD'], metavar='REF',
+                           help='Refs whose history is analyzed (default: HEAD)')
+    ref_group.add_argument('--all', action='store_true', dest='all_refs',
+                           help='Analyze every ref, including unmerged branches, tags and stashes (slower)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore the on-disk timestamp cache')
+    args = parser.parse_args()
+    
+    try:
+        gap_threshold_hours = float(args.gap_hours)
+        if gap_threshold_hours <= 0:
+            print("Error: Gap threshold must be positive", file=sys.stderr)
             sys.exit(1)
+    except ValueError:
+        print(f"Error: Invalid gap threshold '{args.gap_hours}'. Must be a number.", file=sys.stderr)
+        sys.exit(1)
     
     # Fetch git timestamps
+    refs = None if args.all_refs else args.refs
     print("Fetching git commit history...", file=sys.stderr)
-    timestamps = get_git_timestamps()
+    # Relative date windows ("3 months ago") change meaning over time, so
+    # only fixed queries are cached.
+    if args.no_cache or args.since or args.until:
+        timestamps = get_git_timestamps(
+            since=args.since,
+            until=args.until,
+            max_count=args.max_count,
+            refs=refs
+        )
+    else:
+        timestamps = get_cached_git_timestamps(max_count=args.max_count, refs=refs)
     
     if not timestamps:
         print("No commits found in repository", file=sys.stderr)
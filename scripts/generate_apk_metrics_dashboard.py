@@ -16,11 +16,50 @@ Output:
 """
 
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from operator import itemgetter
+from string import Template
+from typing import List, Dict, Optional, Tuple
+
+# Patterns are compiled once at import instead of on every re.search() call
+# Format: "Diffuse Comparison: 1.0.0 → 1.0.1"
+VERSION_RE = re.compile(r'Diffuse Comparison:\s+([\d.]+)\s+→\s+([\d.]+)')
+# Format: " version code │ 1       │ 2       "
+VERSION_CODE_RE = re.compile(r'version code\s+│\s+(\d+)\s+│\s+(\d+)')
+NUMBER_RE = re.compile(r'([+-]?\d+(?:,\d+)*)')
+# Generated date shown in the dashboard header
+GENERATED_DATE_RE = re.compile(r'<strong>Generated:</strong> ([^<\n]*)')
+
+# Summary tables at the top of a slim report, named by their header cell
+SUMMARY_TABLES = frozenset(('APK', 'DEX', 'ARSC'))
+
+# Reports are parsed in worker processes once there are at least this many;
+# for fewer, starting the pool costs more than the parsing itself.
+PARALLEL_PARSE_MIN_REPORTS = 50
+
+# Parse results are cached here between runs, keyed by report name, mtime and
+# size. Bump PARSE_CACHE_VERSION whenever the shape of a parse result changes.
+PARSE_CACHE_PATH = Path("docs/.apk-metrics-cache.json")
+PARSE_CACHE_VERSION = 2
+
+# Columns emitted for the dashboard charts
+APK_COMPONENTS = ('total', 'dex', 'arsc', 'res', 'native', 'asset', 'other')
+# Slot of each APK component in a report's size lists
+APK_COMPONENT_INDEX = {component: i for i, component in enumerate(APK_COMPONENTS)}
+DEX_METRICS = ('files', 'strings', 'types', 'classes', 'methods', 'fields')
+ARSC_METRICS = ('configs', 'entries')
+# Row names kept from the DEX and ARSC tables
+DEX_METRIC_NAMES = frozenset(DEX_METRICS)
+ARSC_METRIC_NAMES = frozenset(ARSC_METRICS)
+
+# Divisor converting each size unit to MiB. "B" must come last since the other
+# units also end with it.
+SIZE_UNIT_DIVISORS = {'MiB': 1, 'KiB': 1024, 'B': 1024 * 1024}
 
 
 class Colors:
@@ -61,19 +100,13 @@ def parse_size_value(size_str: str) -> Optional[float]:
     if not size_str:
         return None
     
-    match = re.search(r'([\d.]+)\s*(MiB|KiB|B)', size_str.strip())
-    if not match:
-        return None
-    
-    value = float(match.group(1))
-    unit = match.group(2)
-    
-    if unit == 'MiB':
-        return value
-    elif unit == 'KiB':
-        return value / 1024
-    elif unit == 'B':
-        return value / (1024 * 1024)
+    size_str = size_str.strip()
+    for unit, divisor in SIZE_UNIT_DIVISORS.items():
+        if size_str.endswith(unit):
+            try:
+                return float(size_str[:-len(unit)]) / divisor
+            except ValueError:
+                return None
     
     return None
 
@@ -90,8 +123,18 @@ def parse_number_value(num_str: str) -> Optional[int]:
     if not num_str:
         return None
     
+    num_str = num_str.strip()
+    
+    # Fast path for the common plain cells ("21,481", "0", "+7 (+123 -116)"):
+    # convert the first token directly without entering the regex engine
+    if num_str and num_str[0] in '+-0123456789':
+        token = num_str.split(None, 1)[0].replace(',', '')
+        digits = token[1:] if token[0] in '+-' else token
+        if digits.isdecimal():
+            return int(token)
+    
     # Extract the main number (first number in the string)
-    match = re.search(r'([+-]?\d+(?:,\d+)*)', num_str.strip())
+    match = NUMBER_RE.search(num_str)
     if not match:
         return None
     
@@ -107,151 +150,153 @@ def parse_diffuse_slim_report(file_path: Path) -> Optional[Dict]:
         - new_version: str
         - old_version_code: int
         - new_version_code: int
-        - apk_sizes: dict with compressed/uncompressed sizes for components
+        - apk_sizes: dict with compressed/uncompressed size lists in MiB,
+          one slot per APK_COMPONENTS entry (0 when absent)
         - dex_metrics: dict with DEX file statistics
         - arsc_metrics: dict with resource statistics
     """
     try:
-        content = file_path.read_text()
-        
-        # Extract version information from header
-        # Format: "Diffuse Comparison: 1.0.0 → 1.0.1"
-        version_match = re.search(r'Diffuse Comparison:\s+([\d.]+)\s+→\s+([\d.]+)', content)
-        if not version_match:
-            log_error(f"Could not find version info in {file_path.name}")
-            return None
-        
-        old_version = version_match.group(1)
-        new_version = version_match.group(2)
-        
-        # Extract version codes from MANIFEST section
-        # Format: " version code │ 1       │ 2       "
-        version_code_match = re.search(r'version code\s+│\s+(\d+)\s+│\s+(\d+)', content)
-        old_version_code = int(version_code_match.group(1)) if version_code_match else None
-        new_version_code = int(version_code_match.group(2)) if version_code_match else None
+        old_version = new_version = None
+        old_version_code = new_version_code = None
+        compressed = [0] * len(APK_COMPONENTS)
+        uncompressed = [0] * len(APK_COMPONENTS)
+        dex_metrics = {}
+        arsc_metrics = {}
         
-        # Parse APK size table (compressed and uncompressed)
-        # The table has format:
+        # Single pass over the lines. Each summary table is a header row, a
+        # "───┼───" separator, then data rows, ending at a blank line:
+        #
         #           │            compressed            │           uncompressed
         #           ├───────────┬───────────┬──────────┼───────────┬───────────┬───────────
-        # APK      │ old       │ new       │ diff     │ old       │ new       │ diff
+        #  APK      │ old       │ new       │ diff     │ old       │ new       │ diff
         # ──────────┼───────────┼───────────┼──────────┼───────────┼───────────┼───────────
-        # dex      │   3.2 MiB │   3.2 MiB │   +912 B │   3.2 MiB │   3.2 MiB │    +912 B
-        
-        apk_table_match = re.search(
-            r'APK\s+│\s+old\s+│\s+new\s+│\s+diff\s+│\s+old\s+│\s+new\s+│\s+diff.*?\n──────────┼(.*?)\n──────────┼',
-            content,
-            re.DOTALL
-        )
-        
-        apk_sizes = {
-            'compressed': {},
-            'uncompressed': {}
-        }
+        #       dex │   3.2 MiB │   3.2 MiB │   +912 B │   3.2 MiB │   3.2 MiB │    +912 B
+        # ──────────┼───────────┼───────────┼──────────┼───────────┼───────────┼───────────
+        #     total │   4.1 MiB │   4.1 MiB │   +8 KiB │   4.1 MiB │   4.1 MiB │ +14.6 KiB
+        #
+        #  DEX     │ old   │ new   │ diff
+        # ─────────┼───────┼───────┼────────────
+        #  strings │ 15957 │ 15958 │ +1 (+4 -3)
+        #
+        # `section` names the table being read; `in_rows` is set once its
+        # separator has been passed. The APK table has a second separator
+        # before its total row, tracked by `apk_separators`.
+        #
+        # The file is streamed line by line and reading stops as soon as the
+        # version header, all three tables and the version code (MANIFEST
+        # section) have been seen, skipping whatever follows.
+        section = None
+        in_rows = False
+        apk_separators = 0
+        parsed_sections = set()
+        completed_sections = set()
         
-        if apk_table_match:
-            table_content = apk_table_match.group(1)
-            for line in table_content.strip().split('\n'):
-                if '│' not in line:
+        with file_path.open('r', encoding='utf-8') as report:
+            for line in report:
+                stripped = line.strip()
+                if not stripped:
+                    if section is not None:
+                        completed_sections.add(section)
+                        section = None
+                        if old_version_code is not None and completed_sections >= SUMMARY_TABLES:
+                            break
                     continue
                 
-                parts = [p.strip() for p in line.split('│')]
-                if len(parts) < 7:
+                if section is None:
+                    if old_version is None:
+                        # Format: "Diffuse Comparison: 1.0.0 → 1.0.1"
+                        version_match = VERSION_RE.search(line)
+                        if version_match:
+                            # Each version is named by two reports (as new, then as
+                            # old), so intern them to share one string
+                            old_version = sys.intern(version_match.group(1))
+                            new_version = sys.intern(version_match.group(2))
+                            continue
+                    
+                    if '│' not in line:
+                        continue
+                    
+                    header = stripped.split(None, 1)[0]
+                    if header in SUMMARY_TABLES and header not in parsed_sections:
+                        section = header
+                        in_rows = False
+                        apk_separators = 0
+                        parsed_sections.add(header)
+                    elif old_version_code is None and stripped.startswith('version code'):
+                        # Format: " version code │ 1       │ 2       "
+                        version_code_match = VERSION_CODE_RE.search(line)
+                        if version_code_match:
+                            old_version_code = int(version_code_match.group(1))
+                            new_version_code = int(version_code_match.group(2))
+                            if completed_sections >= SUMMARY_TABLES:
+                                break
                     continue
                 
-                component = parts[0].strip()
-                if not component:
+                if stripped.startswith('─'):
+                    in_rows = True
+                    if section == 'APK':
+                        apk_separators += 1
                     continue
                 
-                # Parse NEW values (column index 2 for compressed, 5 for uncompressed)
-                new_compressed = parse_size_value(parts[2])
-                new_uncompressed = parse_size_value(parts[5])
-                
-                if new_compressed:
-                    apk_sizes['compressed'][component] = new_compressed
-                if new_uncompressed:
-                    apk_sizes['uncompressed'][component] = new_uncompressed
-        
-        # Parse the total line separately (it comes after the separator)
-        total_match = re.search(
-            r'^\s*total\s+│([^│]+)│([^│]+)│([^│]+)│([^│]+)│([^│]+)│([^│\n]+)',
-            content,
-            re.MULTILINE
-        )
-        if total_match:
-            total_compressed = parse_size_value(total_match.group(2).strip())
-            total_uncompressed = parse_size_value(total_match.group(5).strip())
-            if total_compressed:
-                apk_sizes['compressed']['total'] = total_compressed
-            if total_uncompressed:
-                apk_sizes['uncompressed']['total'] = total_uncompressed
-        
-        # Parse DEX metrics table
-        # Format:
-        # DEX     │ old   │ new   │ diff
-        # files   │     1 │     1 │   0
-        # strings │ 15957 │ 15958 │ +1 (+4 -3)
-        
-        dex_metrics = {}
-        dex_table_match = re.search(
-            r'DEX\s+│.*?\n─+┼─+┼─+┼─+\n(.*?)\n\s*\n',
-            content,
-            re.DOTALL
-        )
-        
-        if dex_table_match:
-            table_content = dex_table_match.group(1)
-            for line in table_content.strip().split('\n'):
-                if '│' not in line:
+                if not in_rows or '│' not in line:
                     continue
                 
-                parts = [p.strip() for p in line.split('│')]
-                if len(parts) < 4:
-                    continue
+                # Split only as far as the columns needed and strip just the cells
+                # that are read; the size/number parsers strip their own input.
+                if section == 'APK':
+                    parts = line.split('│', 6)
+                    if len(parts) < 7:
+                        continue
+                    
+                    component = parts[0].strip()
+                    if apk_separators > 1:
+                        # Only the total row follows the second separator
+                        if component != 'total':
+                            continue
+                    
+                    slot = APK_COMPONENT_INDEX.get(component)
+                    if slot is None:
+                        continue
+                    
+                    # Parse NEW values (column index 2 for compressed, 5 for uncompressed)
+                    new_compressed = parse_size_value(parts[2])
+                    new_uncompressed = parse_size_value(parts[5])
+                    
+                    if new_compressed:
+                        compressed[slot] = new_compressed
+                    if new_uncompressed:
+                        uncompressed[slot] = new_uncompressed
                 
-                metric = parts[0].strip()
-                if metric in ['files', 'strings', 'types', 'classes', 'methods', 'fields']:
-                    # Column 2 is "new" value (0=metric, 1=old, 2=new, 3=diff)
-                    new_value = parse_number_value(parts[2])
-                    if new_value is not None:
-                        dex_metrics[metric] = new_value
-        
-        # Parse ARSC metrics table
-        # Format:
-        # ARSC    │ old │ new │ diff
-        # configs │ 108 │ 108 │   0
-        # entries │ 333 │ 347 │ +14 (+14 -0)
-        
-        arsc_metrics = {}
-        arsc_table_match = re.search(
-            r'ARSC\s+│.*?\n─+┼─+┼─+┼─+\n(.*?)(?:\n\s*\n|$)',
-            content,
-            re.DOTALL
-        )
+                else:
+                    parts = line.split('│', 3)
+                    if len(parts) < 4:
+                        continue
+                    
+                    metric = parts[0].strip()
+                    if section == 'DEX':
+                        allowed = DEX_METRIC_NAMES
+                        metrics = dex_metrics
+                    else:
+                        allowed = ARSC_METRIC_NAMES
+                        metrics = arsc_metrics
+                    
+                    if metric in allowed:
+                        # Column 2 is "new" value (0=metric, 1=old, 2=new, 3=diff)
+                        new_value = parse_number_value(parts[2])
+                        if new_value is not None:
+                            # Interned so every report keys on the same string object
+                            metrics[sys.intern(metric)] = new_value
         
-        if arsc_table_match:
-            table_content = arsc_table_match.group(1)
-            for line in table_content.strip().split('\n'):
-                if '│' not in line:
-                    continue
-                
-                parts = [p.strip() for p in line.split('│')]
-                if len(parts) < 4:
-                    continue
-                
-                metric = parts[0].strip()
-                if metric in ['configs', 'entries']:
-                    # Column 2 is "new" value (0=metric, 1=old, 2=new, 3=diff)
-                    new_value = parse_number_value(parts[2])
-                    if new_value is not None:
-                        arsc_metrics[metric] = new_value
+        if old_version is None:
+            log_error(f"Could not find version info in {file_path.name}")
+            return None
         
         return {
             'old_version': old_version,
             'new_version': new_version,
             'old_version_code': old_version_code,
             'new_version_code': new_version_code,
-            'apk_sizes': apk_sizes,
+            'apk_sizes': {'compressed': compressed, 'uncompressed': uncompressed},
             'dex_metrics': dex_metrics,
             'arsc_metrics': arsc_metrics
         }
@@ -261,178 +306,275 @@ def parse_diffuse_slim_report(file_path: Path) -> Optional[Dict]:
         return None
 
 
-def build_cumulative_data(parsed_reports: List[Dict]) -> List[Dict]:
+def parse_reports(report_paths: List[Path]) -> List[Optional[Dict]]:
+    """
+    Parse slim reports, fanning out across CPU cores for large report sets.
+    
+    Returns one parse result (or None on failure) per path, in input order.
+    """
+    if len(report_paths) < PARALLEL_PARSE_MIN_REPORTS:
+        return [parse_diffuse_slim_report(path) for path in report_paths]
+    
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(parse_diffuse_slim_report, report_paths, chunksize=4))
+
+
+def find_slim_reports(reports_dir: Path) -> List[Tuple[Path, os.stat_result]]:
+    """
+    List slim reports in a directory with their stat results, sorted by name.
+    
+    A single scandir pass provides both the paths and the stats used for the
+    parse cache keys, instead of a glob followed by a stat() per file.
+    """
+    with os.scandir(reports_dir) as entries:
+        reports = [
+            (Path(entry.path), entry.stat())
+            for entry in entries
+            if entry.name.endswith('-slim.txt') and entry.is_file()
+        ]
+    reports.sort(key=lambda report: report[0].name)
+    return reports
+
+
+def get_report_cache_key(report_path: Path, stat: os.stat_result) -> str:
+    """Key identifying a report's current contents without reading it."""
+    return f"{report_path.name}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def load_parse_cache(cache_path: Path) -> Dict[str, Dict]:
+    """Load cached parse results, or an empty cache if missing or stale."""
+    try:
+        cache = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != PARSE_CACHE_VERSION:
+        return {}
+    return cache.get('reports', {})
+
+
+def save_parse_cache(cache_path: Path, reports: Dict[str, Dict]):
+    """Write parse results back for the next run."""
+    cache = {'version': PARSE_CACHE_VERSION, 'reports': reports}
+    cache_path.write_text(json.dumps(cache, separators=(',', ':'), ensure_ascii=False), encoding='utf-8')
+
+
+def parse_reports_cached(reports: List[Tuple[Path, os.stat_result]], cache_path: Path) -> List[Optional[Dict]]:
+    """
+    Parse slim reports, reusing results from earlier runs for unchanged files.
+    
+    Takes (path, stat) pairs as returned by find_slim_reports. Only new or
+    modified reports are parsed. The cache is rewritten with just the current
+    reports' entries, so results for deleted files don't pile up.
+    """
+    cached = load_parse_cache(cache_path)
+    report_paths = [path for path, _ in reports]
+    keys = [get_report_cache_key(path, stat) for path, stat in reports]
+    results = [cached.get(key) for key in keys]
+    
+    missing = [i for i, result in enumerate(results) if result is None]
+    if len(missing) < len(report_paths):
+        log_info(f"Reusing {len(report_paths) - len(missing)} cached report(s)")
+    for i, parsed in zip(missing, parse_reports([report_paths[i] for i in missing])):
+        results[i] = parsed
+    
+    reports = {key: result for key, result in zip(keys, results) if result is not None}
+    if reports != cached:
+        try:
+            save_parse_cache(cache_path, reports)
+        except OSError as e:
+            log_error(f"Failed to write parse cache {cache_path}: {e}")
+    return results
+
+
+def build_cumulative_data(parsed_reports: List[Dict]) -> Dict:
     """
     Build cumulative version data from parsed reports.
     
     Each report shows old -> new, so we need to:
     1. Start with the first version (old from first report)
     2. Add each new version from subsequent reports
+    
+    The result is column oriented: one list per metric, indexed by version,
+    so each chart dataset binds to a list directly and the embedded JSON
+    doesn't repeat every key for every version. Missing values are 0.
+    sizeChanges (KiB) and versionTransitions have one entry per release
+    after the first.
     """
+    cumulative_data = {
+        'versions': [],
+        'versionCodes': [],
+        'compressed': {component: [] for component in APK_COMPONENTS},
+        'uncompressed': {component: [] for component in APK_COMPONENTS},
+        'dex': {metric: [] for metric in DEX_METRICS},
+        'arsc': {metric: [] for metric in ARSC_METRICS},
+        'sizeChanges': [],
+        'versionTransitions': []
+    }
     if not parsed_reports:
-        return []
+        return cumulative_data
     
-    # Sort reports by version code to ensure correct order
-    sorted_reports = sorted(parsed_reports, key=lambda r: r['new_version_code'])
+    def add_version(version, version_code, report):
+        cumulative_data['versions'].append(version)
+        cumulative_data['versionCodes'].append(version_code)
+        for size_type in ('compressed', 'uncompressed'):
+            # Both follow APK_COMPONENTS order, so slots line up with columns
+            for column, size in zip(cumulative_data[size_type].values(), report['apk_sizes'][size_type]):
+                column.append(size)
+        for metric, column in cumulative_data['dex'].items():
+            column.append(report['dex_metrics'].get(metric, 0))
+        for metric, column in cumulative_data['arsc'].items():
+            column.append(report['arsc_metrics'].get(metric, 0))
     
-    cumulative_data = []
+    # Sort reports by version code to ensure correct order
+    sorted_reports = sorted(parsed_reports, key=itemgetter('new_version_code'))
     
     # Add the first version (old from first report)
     first_report = sorted_reports[0]
-    cumulative_data.append({
-        'version': first_report['old_version'],
-        'versionCode': first_report['old_version_code'],
-        'compressed': first_report['apk_sizes']['compressed'],
-        'uncompressed': first_report['apk_sizes']['uncompressed'],
-        'dex': first_report['dex_metrics'],
-        'arsc': first_report['arsc_metrics']
-    })
+    add_version(first_report['old_version'], first_report['old_version_code'], first_report)
     
     # Add all subsequent versions (new from each report)
     for report in sorted_reports:
-        cumulative_data.append({
-            'version': report['new_version'],
-            'versionCode': report['new_version_code'],
-            'compressed': report['apk_sizes']['compressed'],
-            'uncompressed': report['apk_sizes']['uncompressed'],
-            'dex': report['dex_metrics'],
-            'arsc': report['arsc_metrics']
-        })
+        add_version(report['new_version'], report['new_version_code'], report)
+    
+    # Per-release deltas for the size changes chart, computed once here rather
+    # than on every page load
+    versions = cumulative_data['versions']
+    totals = cumulative_data['compressed']['total']
+    cumulative_data['sizeChanges'] = [(total - prev) * 1024 for prev, total in zip(totals, totals[1:])]
+    cumulative_data['versionTransitions'] = [f"{old} → {new}" for old, new in zip(versions, versions[1:])]
     
     return cumulative_data
 
 
-def generate_dashboard_html(cumulative_data: List[Dict], output_path: Path):
-    """Generate the static HTML dashboard with embedded data."""
-    
-    # Convert data to JavaScript format
-    js_data = json.dumps(cumulative_data, indent=12)
-    
-    generated_date = datetime.now().strftime('%B %d, %Y')
-    
-    html_content = f'''<!DOCTYPE html>
+class DashboardTemplate(Template):
+    """Template with "@@" placeholders, which don't clash with CSS braces or JS `${...}` literals."""
+    delimiter = '@@'
+
+
+# Static dashboard page, parsed once at import. Placeholders: @@{js_data}, @@{generated_date}
+DASHBOARD_TEMPLATE = DashboardTemplate('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>TRMNL Android Buddy - APK Metrics Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+    <script defer src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: #333;
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 16px;
             padding: 30px;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-        }}
+        }
         
-        header {{
+        header {
             text-align: center;
             margin-bottom: 40px;
             padding-bottom: 20px;
             border-bottom: 3px solid #667eea;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2.5em;
             color: #667eea;
             margin-bottom: 10px;
-        }}
+        }
         
-        .subtitle {{
+        .subtitle {
             color: #666;
             font-size: 1.1em;
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 20px;
             border-radius: 12px;
             box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.9em;
             opacity: 0.9;
             margin-bottom: 8px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2em;
             font-weight: bold;
-        }}
+        }
         
-        .chart-container {{
+        .chart-container {
             margin-bottom: 50px;
             background: #f8f9fa;
             padding: 25px;
             border-radius: 12px;
             box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        }}
+        }
         
-        .chart-title {{
+        .chart-title {
             font-size: 1.5em;
             color: #667eea;
             margin-bottom: 20px;
             font-weight: 600;
-        }}
+        }
         
-        .chart-wrapper {{
+        .chart-wrapper {
             position: relative;
             height: 400px;
-        }}
+        }
         
-        .chart-wrapper.tall {{
+        .chart-wrapper.tall {
             height: 500px;
-        }}
+        }
         
-        footer {{
+        footer {
             text-align: center;
             margin-top: 40px;
             padding-top: 20px;
             border-top: 2px solid #e0e0e0;
             color: #666;
-        }}
+        }
         
-        .source-info {{
+        .source-info {
             background: #e3f2fd;
             padding: 15px;
             border-radius: 8px;
             margin-bottom: 30px;
             border-left: 4px solid #2196f3;
-        }}
+        }
         
-        footer a {{
+        footer a {
             color: #667eea;
             text-decoration: none;
-        }}
+        }
         
-        footer a:hover {{
+        footer a:hover {
             text-decoration: underline;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -445,7 +587,7 @@ def generate_dashboard_html(cumulative_data: List[Dict], output_path: Path):
         <div class="source-info">
             <strong>📝 Data Source:</strong> Diffuse reports from <code>docs/apk-diffs/*-slim.txt</code> 
             | <strong>Versions:</strong> <span id="version-range"></span>
-            | <strong>Generated:</strong> {generated_date}
+            | <strong>Generated:</strong> @@{generated_date}
         </div>
 
         <div class="stats-grid" id="summary-stats">
@@ -502,367 +644,393 @@ def generate_dashboard_html(cumulative_data: List[Dict], output_path: Path):
     </div>
 
     <script>
-        // Data extracted from diffuse slim reports
-        const diffuseData = {js_data};
+        // Chart.js is loaded with defer, so build the charts once it has run
+        document.addEventListener('DOMContentLoaded', () => {
+            // Data extracted from diffuse slim reports
+            const diffuseData = @@{js_data};
 
-        // Extract versions
-        const versions = diffuseData.map(d => d.version);
+            // Column-oriented data: each metric is an array indexed by version
+            const versions = diffuseData.versions;
+            const totalSizes = diffuseData.compressed.total;
+            const methodCounts = diffuseData.dex.methods;
+            const classCounts = diffuseData.dex.classes;
+            const last = versions.length - 1;
         
-        // Update version range
-        if (versions.length > 0) {{
-            document.getElementById('version-range').textContent = 
-                `${{versions[0]}} → ${{versions[versions.length - 1]}} (${{versions.length}} releases)`;
-        }}
-
-        // Calculate summary statistics
-        const firstVersion = diffuseData[0];
-        const lastVersion = diffuseData[diffuseData.length - 1];
-        const totalSizeGrowth = (lastVersion.compressed.total - firstVersion.compressed.total) * 1024 * 1024;
-        const methodsGrowth = lastVersion.dex.methods - firstVersion.dex.methods;
-        const classesGrowth = lastVersion.dex.classes - firstVersion.dex.classes;
-
-        // Format bytes to human readable
-        function formatBytes(bytes) {{
-            if (bytes >= 1024 * 1024) return (bytes / (1024 * 1024)).toFixed(2) + ' MiB';
-            if (bytes >= 1024) return (bytes / 1024).toFixed(2) + ' KiB';
-            return bytes.toFixed(0) + ' B';
-        }}
-
-        // Populate summary stats
-        const summaryStats = document.getElementById('summary-stats');
-        summaryStats.innerHTML = `
-            <div class="stat-card">
-                <div class="stat-label">Total Releases</div>
-                <div class="stat-value">${{diffuseData.length}}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Current APK Size</div>
-                <div class="stat-value">${{lastVersion.compressed.total.toFixed(2)}} MiB</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Size Growth</div>
-                <div class="stat-value">${{totalSizeGrowth > 0 ? '+' : ''}}${{formatBytes(totalSizeGrowth)}}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Method Count</div>
-                <div class="stat-value">${{lastVersion.dex.methods.toLocaleString()}}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Methods Added</div>
-                <div class="stat-value">+${{methodsGrowth.toLocaleString()}}</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-label">Classes Added</div>
-                <div class="stat-value">+${{classesGrowth.toLocaleString()}}</div>
-            </div>
-        `;
-
-        // Chart.js default configuration
-        Chart.defaults.font.family = '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif';
-        Chart.defaults.color = '#666';
-
-        // 1. Total APK Size Over Time
-        new Chart(document.getElementById('apkSizeChart'), {{
-            type: 'line',
-            data: {{
-                labels: versions,
-                datasets: [{{
-                    label: 'Compressed APK Size',
-                    data: diffuseData.map(d => d.compressed.total),
-                    borderColor: '#667eea',
-                    backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                    borderWidth: 3,
-                    fill: true,
-                    tension: 0.3,
-                    pointRadius: 4,
-                    pointHoverRadius: 6
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: (context) => `${{context.dataset.label}}: ${{context.parsed.y.toFixed(2)}} MiB`
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: false,
-                        title: {{ display: true, text: 'Size (MiB)' }}
-                    }},
-                    x: {{
-                        title: {{ display: true, text: 'Version' }}
-                    }}
-                }}
-            }}
-        }});
-
-        // 2. APK Size Breakdown by Component (Stacked Area)
-        new Chart(document.getElementById('componentBreakdownChart'), {{
-            type: 'line',
-            data: {{
-                labels: versions,
-                datasets: [
-                    {{
-                        label: 'DEX',
-                        data: diffuseData.map(d => d.compressed.dex || 0),
-                        borderColor: '#667eea',
-                        backgroundColor: 'rgba(102, 126, 234, 0.7)',
-                        fill: true
-                    }},
-                    {{
-                        label: 'Resources (ARSC)',
-                        data: diffuseData.map(d => d.compressed.arsc || 0),
-                        borderColor: '#764ba2',
-                        backgroundColor: 'rgba(118, 75, 162, 0.7)',
-                        fill: true
-                    }},
-                    {{
-                        label: 'Res Files',
-                        data: diffuseData.map(d => d.compressed.res || 0),
-                        borderColor: '#f093fb',
-                        backgroundColor: 'rgba(240, 147, 251, 0.7)',
-                        fill: true
-                    }},
-                    {{
-                        label: 'Native Libs',
-                        data: diffuseData.map(d => d.compressed.native || 0),
-                        borderColor: '#4facfe',
-                        backgroundColor: 'rgba(79, 172, 254, 0.7)',
-                        fill: true
-                    }},
-                    {{
-                        label: 'Assets',
-                        data: diffuseData.map(d => d.compressed.asset || 0),
-                        borderColor: '#43e97b',
-                        backgroundColor: 'rgba(67, 233, 123, 0.7)',
-                        fill: true
-                    }},
-                    {{
-                        label: 'Other',
-                        data: diffuseData.map(d => d.compressed.other || 0),
-                        borderColor: '#fa709a',
-                        backgroundColor: 'rgba(250, 112, 154, 0.7)',
-                        fill: true
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true, position: 'bottom' }},
-                    tooltip: {{
-                        mode: 'index',
-                        callbacks: {{
-                            label: (context) => `${{context.dataset.label}}: ${{context.parsed.y.toFixed(2)}} MiB`
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        stacked: true,
-                        title: {{ display: true, text: 'Size (MiB)' }}
-                    }},
-                    x: {{
-                        stacked: true,
-                        title: {{ display: true, text: 'Version' }}
-                    }}
-                }}
-            }}
-        }});
-
-        // 3. Size Changes Between Versions
-        const sizeChanges = diffuseData.slice(1).map((d, i) => 
-            (d.compressed.total - diffuseData[i].compressed.total) * 1024
-        );
-        const versionTransitions = diffuseData.slice(1).map((d, i) => 
-            `${{diffuseData[i].version}} → ${{d.version}}`
-        );
-
-        new Chart(document.getElementById('sizeChangesChart'), {{
-            type: 'bar',
-            data: {{
-                labels: versionTransitions,
-                datasets: [{{
-                    label: 'Size Change',
-                    data: sizeChanges,
-                    backgroundColor: sizeChanges.map(v => v >= 0 ? 'rgba(244, 67, 54, 0.7)' : 'rgba(76, 175, 80, 0.7)'),
-                    borderColor: sizeChanges.map(v => v >= 0 ? '#f44336' : '#4caf50'),
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: (context) => {{
-                                const val = context.parsed.y;
-                                return `${{val >= 0 ? '+' : ''}}${{val.toFixed(2)}} KiB`;
-                            }}
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        title: {{ display: true, text: 'Size Change (KiB)' }},
-                        grid: {{ color: (context) => context.tick.value === 0 ? '#333' : 'rgba(0, 0, 0, 0.1)' }}
-                    }},
-                    x: {{
-                        title: {{ display: true, text: 'Version Transition' }},
-                        ticks: {{ maxRotation: 90, minRotation: 45 }}
-                    }}
-                }}
-            }}
-        }});
-
-        // 4. DEX Metrics Evolution
-        new Chart(document.getElementById('dexMetricsChart'), {{
-            type: 'line',
-            data: {{
-                labels: versions,
-                datasets: [
-                    {{
-                        label: 'Strings',
-                        data: diffuseData.map(d => d.dex.strings || 0),
+            // Update version range
+            if (versions.length > 0) {
+                document.getElementById('version-range').textContent = 
+                    `${versions[0]} → ${versions[versions.length - 1]} (${versions.length} releases)`;
+            }
+
+            // Calculate summary statistics
+            const totalSizeGrowth = (totalSizes[last] - totalSizes[0]) * 1024 * 1024;
+            const methodsGrowth = methodCounts[last] - methodCounts[0];
+            const classesGrowth = classCounts[last] - classCounts[0];
+
+            // Format bytes to human readable
+            function formatBytes(bytes) {
+                if (bytes >= 1024 * 1024) return (bytes / (1024 * 1024)).toFixed(2) + ' MiB';
+                if (bytes >= 1024) return (bytes / 1024).toFixed(2) + ' KiB';
+                return bytes.toFixed(0) + ' B';
+            }
+
+            // Populate summary stats
+            const summaryStats = document.getElementById('summary-stats');
+            summaryStats.innerHTML = `
+                <div class="stat-card">
+                    <div class="stat-label">Total Releases</div>
+                    <div class="stat-value">${versions.length}</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Current APK Size</div>
+                    <div class="stat-value">${totalSizes[last].toFixed(2)} MiB</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Size Growth</div>
+                    <div class="stat-value">${totalSizeGrowth > 0 ? '+' : ''}${formatBytes(totalSizeGrowth)}</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Method Count</div>
+                    <div class="stat-value">${methodCounts[last].toLocaleString()}</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Methods Added</div>
+                    <div class="stat-value">+${methodsGrowth.toLocaleString()}</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-label">Classes Added</div>
+                    <div class="stat-value">+${classesGrowth.toLocaleString()}</div>
+                </div>
+            `;
+
+            // Chart.js default configuration
+            Chart.defaults.font.family = '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif';
+            Chart.defaults.color = '#666';
+
+            // 1. Total APK Size Over Time
+            new Chart(document.getElementById('apkSizeChart'), {
+                type: 'line',
+                data: {
+                    labels: versions,
+                    datasets: [{
+                        label: 'Compressed APK Size',
+                        data: totalSizes,
                         borderColor: '#667eea',
                         backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.3,
-                        yAxisID: 'y'
-                    }},
-                    {{
-                        label: 'Types',
-                        data: diffuseData.map(d => d.dex.types || 0),
-                        borderColor: '#764ba2',
-                        backgroundColor: 'rgba(118, 75, 162, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.3,
-                        yAxisID: 'y'
-                    }},
-                    {{
-                        label: 'Classes',
-                        data: diffuseData.map(d => d.dex.classes || 0),
-                        borderColor: '#f093fb',
-                        backgroundColor: 'rgba(240, 147, 251, 0.1)',
-                        borderWidth: 2,
-                        tension: 0.3,
-                        yAxisID: 'y'
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true, position: 'bottom' }}
-                }},
-                scales: {{
-                    y: {{
-                        type: 'linear',
-                        display: true,
-                        position: 'left',
-                        title: {{ display: true, text: 'Count' }}
-                    }},
-                    x: {{
-                        title: {{ display: true, text: 'Version' }}
-                    }}
-                }}
-            }}
-        }});
-
-        // 5. Methods and Fields Count
-        new Chart(document.getElementById('methodsFieldsChart'), {{
-            type: 'line',
-            data: {{
-                labels: versions,
-                datasets: [
-                    {{
-                        label: 'Methods',
-                        data: diffuseData.map(d => d.dex.methods || 0),
-                        borderColor: '#667eea',
-                        backgroundColor: 'rgba(102, 126, 234, 0.2)',
-                        borderWidth: 3,
-                        fill: true,
-                        tension: 0.3,
-                        pointRadius: 4
-                    }},
-                    {{
-                        label: 'Fields',
-                        data: diffuseData.map(d => d.dex.fields || 0),
-                        borderColor: '#43e97b',
-                        backgroundColor: 'rgba(67, 233, 123, 0.2)',
                         borderWidth: 3,
                         fill: true,
                         tension: 0.3,
-                        pointRadius: 4
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true, position: 'top' }},
-                    tooltip: {{
-                        callbacks: {{
-                            label: (context) => `${{context.dataset.label}}: ${{context.parsed.y.toLocaleString()}}`
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        title: {{ display: true, text: 'Count' }}
-                    }},
-                    x: {{
-                        title: {{ display: true, text: 'Version' }}
-                    }}
-                }}
-            }}
-        }});
-
-        // 6. Resource Entries Over Time
-        new Chart(document.getElementById('resourcesChart'), {{
-            type: 'bar',
-            data: {{
-                labels: versions,
-                datasets: [{{
-                    label: 'ARSC Entries',
-                    data: diffuseData.map(d => d.arsc.entries || 0),
-                    backgroundColor: 'rgba(102, 126, 234, 0.7)',
-                    borderColor: '#667eea',
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: true }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{ display: true, text: 'Number of Entries' }}
-                    }},
-                    x: {{
-                        title: {{ display: true, text: 'Version' }}
-                    }}
-                }}
-            }}
-        }});
+                        pointRadius: 4,
+                        pointHoverRadius: 6
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: true },
+                        tooltip: {
+                            callbacks: {
+                                label: (context) => `${context.dataset.label}: ${context.parsed.y.toFixed(2)} MiB`
+                            }
+                        }
+                    },
+                    scales: {
+                        y: {
+                            beginAtZero: false,
+                            title: { display: true, text: 'Size (MiB)' }
+                        },
+                        x: {
+                            title: { display: true, text: 'Version' }
+                        }
+                    }
+                }
+            });
+
+            // 2. APK Size Breakdown by Component (Stacked Area)
+            new Chart(document.getElementById('componentBreakdownChart'), {
+                type: 'line',
+                data: {
+                    labels: versions,
+                    datasets: [
+                        {
+                            label: 'DEX',
+                            data: diffuseData.compressed.dex,
+                            borderColor: '#667eea',
+                            backgroundColor: 'rgba(102, 126, 234, 0.7)',
+                            fill: true
+                        },
+                        {
+                            label: 'Resources (ARSC)',
+                            data: diffuseData.compressed.arsc,
+                            borderColor: '#764ba2',
+                            backgroundColor: 'rgba(118, 75, 162, 0.7)',
+                            fill: true
+                        },
+                        {
+                            label: 'Res Files',
+                            data: diffuseData.compressed.res,
+                            borderColor: '#f093fb',
+                            backgroundColor: 'rgba(240, 147, 251, 0.7)',
+                            fill: true
+                        },
+                        {
+                            label: 'Native Libs',
+                            data: diffuseData.compressed.native,
+                            borderColor: '#4facfe',
+                            backgroundColor: 'rgba(79, 172, 254, 0.7)',
+                            fill: true
+                        },
+                        {
+                            label: 'Assets',
+                            data: diffuseData.compressed.asset,
+                            borderColor: '#43e97b',
+                            backgroundColor: 'rgba(67, 233, 123, 0.7)',
+                            fill: true
+                        },
+                        {
+                            label: 'Other',
+                            data: diffuseData.compressed.other,
+                            borderColor: '#fa709a',
+                            backgroundColor: 'rgba(250, 112, 154, 0.7)',
+                            fill: true
+                        }
+                    ]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: true, position: 'bottom' },
+                        tooltip: {
+                            mode: 'index',
+                            callbacks: {
+                                label: (context) => `${context.dataset.label}: ${context.parsed.y.toFixed(2)} MiB`
+                            }
+                        }
+                    },
+                    scales: {
+                        y: {
+                            stacked: true,
+                            title: { display: true, text: 'Size (MiB)' }
+                        },
+                        x: {
+                            stacked: true,
+                            title: { display: true, text: 'Version' }
+                        }
+                    }
+                }
+            });
+
+            // 3. Size Changes Between Versions
+            const sizeChanges = diffuseData.sizeChanges;
+            const versionTransitions = diffuseData.versionTransitions;
+
+            new Chart(document.getElementById('sizeChangesChart'), {
+                type: 'bar',
+                data: {
+                    labels: versionTransitions,
+                    datasets: [{
+                        label: 'Size Change',
+                        data: sizeChanges,
+                        backgroundColor: sizeChanges.map(v => v >= 0 ? 'rgba(244, 67, 54, 0.7)' : 'rgba(76, 175, 80, 0.7)'),
+                        borderColor: sizeChanges.map(v => v >= 0 ? '#f44336' : '#4caf50'),
+                        borderWidth: 1
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: false },
+                        tooltip: {
+                            callbacks: {
+                                label: (context) => {
+                                    const val = context.parsed.y;
+                                    return `${val >= 0 ? '+' : ''}${val.toFixed(2)} KiB`;
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        y: {
+                            title: { display: true, text: 'Size Change (KiB)' },
+                            grid: { color: (context) => context.tick.value === 0 ? '#333' : 'rgba(0, 0, 0, 0.1)' }
+                        },
+                        x: {
+                            title: { display: true, text: 'Version Transition' },
+                            ticks: { maxRotation: 90, minRotation: 45 }
+                        }
+                    }
+                }
+            });
+
+            // 4. DEX Metrics Evolution
+            new Chart(document.getElementById('dexMetricsChart'), {
+                type: 'line',
+                data: {
+                    labels: versions,
+                    datasets: [
+                        {
+                            label: 'Strings',
+                            data: diffuseData.dex.strings,
+                            borderColor: '#667eea',
+                            backgroundColor: 'rgba(102, 126, 234, 0.1)',
+                            borderWidth: 2,
+                            tension: 0.3,
+                            yAxisID: 'y'
+                        },
+                        {
+                            label: 'Types',
+                            data: diffuseData.dex.types,
+                            borderColor: '#764ba2',
+                            backgroundColor: 'rgba(118, 75, 162, 0.1)',
+                            borderWidth: 2,
+                            tension: 0.3,
+                            yAxisID: 'y'
+                        },
+                        {
+                            label: 'Classes',
+                            data: diffuseData.dex.classes,
+                            borderColor: '#f093fb',
+                            backgroundColor: 'rgba(240, 147, 251, 0.1)',
+                            borderWidth: 2,
+                            tension: 0.3,
+                            yAxisID: 'y'
+                        }
+                    ]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: true, position: 'bottom' }
+                    },
+                    scales: {
+                        y: {
+                            type: 'linear',
+                            display: true,
+                            position: 'left',
+                            title: { display: true, text: 'Count' }
+                        },
+                        x: {
+                            title: { display: true, text: 'Version' }
+                        }
+                    }
+                }
+            });
+
+            // 5. Methods and Fields Count
+            new Chart(document.getElementById('methodsFieldsChart'), {
+                type: 'line',
+                data: {
+                    labels: versions,
+                    datasets: [
+                        {
+                            label: 'Methods',
+                            data: diffuseData.dex.methods,
+                            borderColor: '#667eea',
+                            backgroundColor: 'rgba(102, 126, 234, 0.2)',
+                            borderWidth: 3,
+                            fill: true,
+                            tension: 0.3,
+                            pointRadius: 4
+                        },
+                        {
+                            label: 'Fields',
+                            data: diffuseData.dex.fields,
+                            borderColor: '#43e97b',
+                            backgroundColor: 'rgba(67, 233, 123, 0.2)',
+                            borderWidth: 3,
+                            fill: true,
+                            tension: 0.3,
+                            pointRadius: 4
+                        }
+                    ]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: true, position: 'top' },
+                        tooltip: {
+                            callbacks: {
+                                label: (context) => `${context.dataset.label}: ${context.parsed.y.toLocaleString()}`
+                            }
+                        }
+                    },
+                    scales: {
+                        y: {
+                            title: { display: true, text: 'Count' }
+                        },
+                        x: {
+                            title: { display: true, text: 'Version' }
+                        }
+                    }
+                }
+            });
+
+            // 6. Resource Entries Over Time
+            new Chart(document.getElementById('resourcesChart'), {
+                type: 'bar',
+                data: {
+                    labels: versions,
+                    datasets: [{
+                        label: 'ARSC Entries',
+                        data: diffuseData.arsc.entries,
+                        backgroundColor: 'rgba(102, 126, 234, 0.7)',
+                        borderColor: '#667eea',
+                        borderWidth: 1
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {
+                        legend: { display: true }
+                    },
+                    scales: {
+                        y: {
+                            beginAtZero: true,
+                            title: { display: true, text: 'Number of Entries' }
+                        },
+                        x: {
+                            title: { display: true, text: 'Version' }
+                        }
+                    }
+                }
+            });
+        });
     </script>
 </body>
-</html>'''
+</html>''')
+
+
+def generate_dashboard_html(cumulative_data: Dict, output_path: Path):
+    """Generate the static HTML dashboard with embedded data."""
+    
+    # Convert data to compact JavaScript (no indentation) to keep the page small
+    js_data = json.dumps(cumulative_data, separators=(',', ':'), ensure_ascii=False)
+    
+    # Leave the file untouched when only the generated date would change, so
+    # its mtime (and anything watching it) only moves when the data does.
+    # The existing page is re-rendered with its own date for the comparison.
+    try:
+        existing_html = output_path.read_bytes().decode('utf-8')
+    except (OSError, UnicodeDecodeError):
+        existing_html = None
+    if existing_html is not None:
+        date_match = GENERATED_DATE_RE.search(existing_html)
+        if date_match and DASHBOARD_TEMPLATE.substitute(js_data=js_data, generated_date=date_match.group(1)) == existing_html:
+            log_info(f"Dashboard unchanged: {output_path}")
+            return
+    
+    generated_date = datetime.now().strftime('%B %d, %Y')
+    html_content = DASHBOARD_TEMPLATE.substitute(js_data=js_data, generated_date=generated_date)
     
-    output_path.write_text(html_content)
+    # Encode once and write the bytes directly instead of going through the
+    # text layer; this also pins the file to UTF-8 whatever the locale.
+    output_path.write_bytes(html_content.encode('utf-8'))
     log_success(f"Dashboard generated: {output_path}")
 
 
@@ -876,21 +1044,20 @@ def main():
         log_error(f"Directory not found: {slim_reports_dir}")
         return 1
     
-    slim_files = sorted(slim_reports_dir.glob("*-slim.txt"))
-    if not slim_files:
+    slim_reports = find_slim_reports(slim_reports_dir)
+    if not slim_reports:
         log_error(f"No slim diffuse reports found in {slim_reports_dir}")
         return 1
     
-    log_info(f"Found {len(slim_files)} slim diffuse reports")
+    log_info(f"Found {len(slim_reports)} slim diffuse reports")
     
     # Parse all reports
+    log_info("Parsing reports...")
     parsed_reports = []
-    for slim_file in slim_files:
-        log_info(f"Parsing {slim_file.name}...")
-        parsed = parse_diffuse_slim_report(slim_file)
+    for (slim_file, _), parsed in zip(slim_reports, parse_reports_cached(slim_reports, PARSE_CACHE_PATH)):
         if parsed:
             parsed_reports.append(parsed)
-            log_success(f"  ✓ {parsed['old_version']} → {parsed['new_version']}")
+            log_success(f"  ✓ {slim_file.name}: {parsed['old_version']} → {parsed['new_version']}")
     
     if not parsed_reports:
         log_error("No reports could be parsed successfully")
@@ -901,7 +1068,7 @@ def main():
     # Build cumulative data
     log_info("Building cumulative version data...")
     cumulative_data = build_cumulative_data(parsed_reports)
-    log_success(f"Generated data for {len(cumulative_data)} versions")
+    log_success(f"Generated data for {len(cumulative_data['versions'])} versions")
     
     # Generate dashboard
     output_path = Path("docs/apk-metrics-dashboard.html")
@@ -3,7 +3,7 @@
 Generate APK size trend report using Diffuse.
 
 This script:
-1. Clones and builds Diffuse from GitHub source
+1. Verifies the pre-built Diffuse committed in scripts/diffuse/
 2. Loads release metadata from releases.json
 3. Downloads APKs for each release
 4. Runs Diffuse comparisons between consecutive releases
@@ -17,22 +17,67 @@ Output:
     - docs/apk-diffs/ - Directory with individual comparison reports
 """
 
+import hashlib
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
 # Configuration
 GITHUB_REPO = "hossain-khan/trmnl-android-buddy"
 WORK_DIR = Path("build/apk-trend-analysis")
 DIFFUSE_BIN = Path("scripts/diffuse/bin/diffuse")  # Pre-built binary committed to repo
+DIFFUSE_LIB_DIR = Path("scripts/diffuse/lib")  # JARs the binary runs
 OUTPUT_DIR = Path("docs/apk-diffs")
 REPORT_PATH = Path("docs/apk-size-trend.md")
+DIFFUSE_CACHE_PATH = WORK_DIR / "_diffuse_cache.json"  # Diffuse output keyed by APK pair hash
+DEX_SECTION_MARKER = "====   DEX   ===="  # Slim reports keep everything before this line
+
+# Pattern for parse_diffuse_output, compiled once at import. One alternative
+# per metric, so a single scan of the output finds all three:
+#   "total │ <size> │ <size> │ <diff> │ ..."
+#   "methods │ <old> │ <new> │ <diff>"
+#   "classes │ <old> │ <new> │ <diff>"
+DIFFUSE_METRICS_RE = re.compile(
+    r'total\s+│[^│]+│[^│]+│\s*(?P<total>[+-]?[\d.]+\s*[KMGT]?i?B)'
+    r'|methods\s+│\s*\d+\s+│\s*\d+\s+│\s*(?P<methods>[+-]?\d+)'
+    r'|classes\s+│\s*\d+\s+│\s*\d+\s+│\s*(?P<classes>[+-]?\d+)'
+)
+# Metric filled from each named group of DIFFUSE_METRICS_RE
+DIFFUSE_METRIC_KEYS = {
+    'total': 'apk_size_compressed_diff',
+    'methods': 'method_count_diff',
+    'classes': 'class_count_diff'
+}
+
+# Downloads are network-bound, so this many run at once
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_REDIRECTS = 5
+
+# Keep-alive HTTP connections of each download thread, keyed by (scheme, host)
+HTTP_CONNECTIONS = threading.local()
+
+# Each Diffuse comparison is its own JVM, so run one per CPU core
+DIFFUSE_WORKERS = os.cpu_count() or 1
+
+# Serializes log lines printed from worker threads
+LOG_LOCK = threading.Lock()
 
 
 class Colors:
@@ -49,22 +94,32 @@ class Colors:
 
 def log_info(message: str):
     """Print info message."""
-    print(f"{Colors.OKBLUE}ℹ {message}{Colors.ENDC}")
+    with LOG_LOCK:
+        print(f"{Colors.OKBLUE}ℹ {message}{Colors.ENDC}")
 
 
 def log_success(message: str):
     """Print success message."""
-    print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
+    with LOG_LOCK:
+        print(f"{Colors.OKGREEN}✓ {message}{Colors.ENDC}")
 
 
 def log_warning(message: str):
     """Print warning message."""
-    print(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
+    with LOG_LOCK:
+        print(f"{Colors.WARNING}⚠ {message}{Colors.ENDC}")
 
 
 def log_error(message: str):
     """Print error message."""
-    print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
+    with LOG_LOCK:
+        print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}")
+
+
+def load_json(path: Path):
+    """Read a JSON file, with orjson when it is installed."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def download_file(url: str, output_path: Path) -> bool:
@@ -79,20 +134,34 @@ def download_file(url: str, output_path: Path) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def load_releases(releases_file: Path, mtime_ns: int) -> Tuple[Dict, ...]:
+    """
+    Parse releases.json and add download URLs, memoized per file version.
+    
+    The file's mtime is part of the cache key, so an edited file is re-read.
+    """
+    releases = load_json(releases_file)
+    
+    # Add apk_url for downloading, and the size in MiB used throughout the report
+    for release in releases:
+        release['apk_url'] = f"https://github.com/{GITHUB_REPO}/releases/download/{release['tag']}/{release['apk_name']}"
+        release['name'] = f"Release {release['tag']}"
+        release['apk_size_mb'] = release['apk_size'] / (1024 * 1024)
+    
+    return tuple(releases)
+
+
 def get_releases() -> List[Dict]:
     """Load releases from the releases.json file."""
     log_info("Loading releases from releases.json...")
     
     try:
         releases_file = Path("scripts/releases.json")
-        with open(releases_file, 'r') as f:
-            releases = json.load(f)
-        
-        # Add apk_url for downloading
-        for release in releases:
-            release['apk_url'] = f"https://github.com/{GITHUB_REPO}/releases/download/{release['tag']}/{release['apk_name']}"
-            release['name'] = f"Release {release['tag']}"
+        cached_releases = load_releases(releases_file, releases_file.stat().st_mtime_ns)
         
+        # Copies, so callers can't modify the memoized releases
+        releases = [dict(release) for release in cached_releases]
         log_success(f"Loaded {len(releases)} releases")
         return releases
     
@@ -110,13 +179,72 @@ def setup_diffuse() -> Path:
     """
     if not DIFFUSE_BIN.exists():
         raise Exception(f"Diffuse binary not found at {DIFFUSE_BIN}. Please ensure scripts/diffuse/ is committed to the repository.")
+    if not any(DIFFUSE_LIB_DIR.glob("*.jar")):
+        raise Exception(f"Diffuse libraries not found in {DIFFUSE_LIB_DIR}. Please ensure scripts/diffuse/ is committed to the repository.")
     
     log_info(f"Using Diffuse binary: {DIFFUSE_BIN}")
     return DIFFUSE_BIN
 
 
+def get_http_connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    """
+    Get this thread's connection to a host, opening it on first use.
+    
+    Connections stay open between requests, so later downloads from the same
+    host skip the TCP and TLS handshakes.
+    """
+    connections = HTTP_CONNECTIONS.__dict__.setdefault('connections', {})
+    connection = connections.get((scheme, host))
+    if connection is None:
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(host, timeout=60)
+        connections[(scheme, host)] = connection
+    return connection
+
+
+def uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    """Whether HTTP(S)_PROXY / NO_PROXY (or system settings) route this URL through a proxy."""
+    return bool(urllib.request.getproxies().get(parts.scheme)) and not urllib.request.proxy_bypass(parts.hostname)
+
+
+def http_get(url: str) -> http.client.HTTPResponse:
+    """
+    Send a GET on a reused connection, following redirects.
+    
+    When a proxy applies, the request goes through urllib instead, which
+    handles the proxy settings and redirects itself.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if uses_proxy(parts):
+            return urllib.request.urlopen(url, timeout=60)
+        
+        connection = get_http_connection(parts.scheme, parts.netloc)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        try:
+            connection.request('GET', target)
+            response = connection.getresponse()
+        except (http.client.HTTPException, OSError):
+            # The server may have dropped an idle keep-alive connection; retry once on a fresh one
+            connection.close()
+            connection.request('GET', target)
+            response = connection.getresponse()
+        
+        if response.status in (301, 302, 303, 307, 308):
+            # Drain the body so the connection can be reused
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader('Location'))
+            continue
+        if response.status != 200:
+            response.read()
+            raise Exception(f"HTTP {response.status} {response.reason} for {url}")
+        return response
+    
+    raise Exception(f"Too many redirects for {url}")
+
+
 def download_apk(release: Dict, work_dir: Path) -> Path:
-    """Download APK for a release using curl."""
+    """Download APK for a release, streaming it to disk."""
     apk_path = work_dir / f"{release['tag']}.apk"
     
     if apk_path.exists():
@@ -124,22 +252,50 @@ def download_apk(release: Dict, work_dir: Path) -> Path:
         return apk_path
     
     log_info(f"Downloading APK for {release['tag']}...")
+    # Write to a temporary file first so a failed download never leaves a
+    # partial APK behind that later runs would take as complete
+    partial_path = apk_path.with_name(apk_path.name + '.part')
     try:
-        # Use curl to download the APK
-        subprocess.run(
-            ['curl', '-L', '-o', str(apk_path), release['apk_url']],
-            check=True,
-            capture_output=True
-        )
-        
-        if apk_path.exists():
-            log_success(f"Downloaded: {apk_path}")
-            return apk_path
-        else:
-            raise Exception(f"APK not found after download: {apk_path}")
-    except subprocess.CalledProcessError as e:
+        response = http_get(release['apk_url'])
+        with open(partial_path, 'wb') as f:
+            for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b''):
+                f.write(chunk)
+        os.replace(partial_path, apk_path)
+    except Exception as e:
+        if partial_path.exists():
+            partial_path.unlink()
         log_error(f"Failed to download APK: {e}")
         raise Exception(f"Failed to download APK for {release['tag']}")
+    
+    log_success(f"Downloaded: {apk_path}")
+    return apk_path
+
+
+def download_apks(releases: List[Dict], work_dir: Path) -> Dict[str, Path]:
+    """
+    Download APKs for all releases concurrently.
+    
+    Downloads spend their time waiting on the network, so a thread pool
+    overlaps their latency. Returns APK paths keyed by release tag.
+    """
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = {
+            release['tag']: executor.submit(download_apk, release, work_dir)
+            for release in releases
+        }
+    
+    apk_paths = {}
+    failed_tags = []
+    for tag, future in futures.items():
+        try:
+            apk_paths[tag] = future.result()
+        except Exception as e:
+            log_error(f"Failed to download APK for {tag}: {e}")
+            failed_tags.append(tag)
+    
+    if failed_tags:
+        raise Exception(f"Failed to download APKs for {', '.join(failed_tags)}")
+    return apk_paths
 
 
 def run_diffuse_comparison(diffuse_bin: Path, old_apk: Path, new_apk: Path) -> str:
@@ -160,6 +316,127 @@ def run_diffuse_comparison(diffuse_bin: Path, old_apk: Path, new_apk: Path) -> s
         return f"ERROR: Diffuse comparison failed\n{e.stderr}"
 
 
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_diffuse_fingerprint(diffuse_bin: Path) -> str:
+    """
+    Content hash of the Diffuse install (launcher script and every JAR).
+    
+    Cached outputs are only valid for the Diffuse build that produced them, so
+    upgrading or modifying scripts/diffuse/ invalidates the cache.
+    """
+    digest = hashlib.sha256()
+    for path in [diffuse_bin] + sorted(DIFFUSE_LIB_DIR.glob("*.jar")):
+        digest.update(f"{path.name}:{hash_file(path)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_diffuse_cache(diffuse_fingerprint: str) -> Dict[str, str]:
+    """Load cached Diffuse outputs, or an empty cache if missing, unreadable or from another Diffuse build."""
+    try:
+        cache = load_json(DIFFUSE_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('diffuse') != diffuse_fingerprint:
+        return {}
+    return cache.get('outputs', {})
+
+
+def save_diffuse_cache(diffuse_fingerprint: str, outputs: Dict[str, str]):
+    """Persist Diffuse outputs for the next run."""
+    try:
+        with open(DIFFUSE_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'diffuse': diffuse_fingerprint, 'outputs': outputs}, f, ensure_ascii=False)
+    except OSError as e:
+        log_warning(f"Failed to save Diffuse cache: {e}")
+
+
+def run_diffuse_comparisons(diffuse_bin: Path, release_pairs: List[Tuple[Dict, Dict]], apk_paths: Dict[str, Path]) -> List[str]:
+    """
+    Run Diffuse on the given (old_release, new_release) pairs concurrently.
+    
+    Outputs are cached by the SHA-256 of both APKs, so pairs whose APKs are
+    unchanged since a previous run with the same Diffuse build skip Diffuse
+    entirely. The work happens in the Diffuse subprocesses, so threads are
+    enough to keep several running at once. Returns the Diffuse output for
+    each pair, in order.
+    """
+    if not release_pairs:
+        return []
+    
+    apk_hashes = {tag: hash_file(apk_path) for tag, apk_path in apk_paths.items()}
+    pair_keys = [
+        f"{apk_hashes[old_release['tag']]}:{apk_hashes[new_release['tag']]}"
+        for old_release, new_release in release_pairs
+    ]
+    
+    diffuse_fingerprint = get_diffuse_fingerprint(diffuse_bin)
+    cache = load_diffuse_cache(diffuse_fingerprint)
+    diff_outputs = [cache.get(key) for key in pair_keys]
+    missing = [i for i, diff_output in enumerate(diff_outputs) if diff_output is None]
+    if len(missing) < len(release_pairs):
+        log_info(f"Reusing {len(release_pairs) - len(missing)} cached Diffuse comparison(s)")
+    
+    def compare(i):
+        old_release, new_release = release_pairs[i]
+        return run_diffuse_comparison(diffuse_bin, apk_paths[old_release['tag']], apk_paths[new_release['tag']])
+    
+    if missing:
+        with ThreadPoolExecutor(max_workers=DIFFUSE_WORKERS) as executor:
+            for i, diff_output in zip(missing, executor.map(compare, missing)):
+                diff_outputs[i] = diff_output
+                # Failures are retried on the next run rather than cached
+                if not diff_output.startswith("ERROR: Diffuse comparison failed"):
+                    cache[pair_keys[i]] = diff_output
+        save_diffuse_cache(diffuse_fingerprint, cache)
+    
+    return diff_outputs
+
+
+def get_report_name(old_release: Dict, new_release: Dict) -> str:
+    """Base file name of the comparison reports for a release pair."""
+    return f"{old_release['tag']}_to_{new_release['tag']}"
+
+
+def get_report_header(old_release: Dict, new_release: Dict) -> str:
+    """Header written above the Diffuse output in a comparison report."""
+    return f"Diffuse Comparison: {old_release['tag']} → {new_release['tag']}\n{'=' * 80}\n\n"
+
+
+def load_saved_comparison(old_release: Dict, new_release: Dict) -> Optional[str]:
+    """
+    Diffuse output from a comparison report saved by a previous run.
+    
+    Returns None unless both the full and slim reports exist in OUTPUT_DIR and
+    the full report holds a successful comparison.
+    """
+    report_name = get_report_name(old_release, new_release)
+    report_file = OUTPUT_DIR / f"{report_name}.txt"
+    slim_report_file = OUTPUT_DIR / f"{report_name}-slim.txt"
+    if not (report_file.exists() and slim_report_file.exists()):
+        return None
+    
+    try:
+        full_report = report_file.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    header = get_report_header(old_release, new_release)
+    if not full_report.startswith(header):
+        return None
+    diff_output = full_report[len(header):]
+    if diff_output.startswith("ERROR: Diffuse comparison failed"):
+        return None
+    return diff_output
+
+
 def parse_diffuse_output(output: str) -> Dict:
     """Parse Diffuse output to extract key metrics."""
     metrics = {
@@ -170,47 +447,36 @@ def parse_diffuse_output(output: str) -> Dict:
         'class_count_diff': None
     }
     
-    # Regex pattern to match the total size difference in the APK table
-    # Format: "total │ <size> │ <size> │ <diff> │ ..."
+    # Total size difference in the APK table plus method and class count
+    # changes, each taken from its first occurrence.
     # Example: "total │ 5.9 MiB │ 6.0 MiB │ +21.3 KiB │ ..."
-    total_match = re.search(r'total\s+│[^│]+│[^│]+│\s*([+-]?[\d.]+\s*[KMGT]?i?B)', output)
-    if total_match:
-        metrics['apk_size_compressed_diff'] = total_match.group(1).strip()
-    
-    # Regex pattern to match method count changes
-    # Format: "methods │ <old> │ <new> │ <diff>"
-    method_match = re.search(r'methods\s+│\s*\d+\s+│\s*\d+\s+│\s*([+-]?\d+)', output)
-    if method_match:
-        metrics['method_count_diff'] = method_match.group(1).strip()
-    
-    # Regex pattern to match class count changes
-    # Format: "classes │ <old> │ <new> │ <diff>"
-    class_match = re.search(r'classes\s+│\s*\d+\s+│\s*\d+\s+│\s*([+-]?\d+)', output)
-    if class_match:
-        metrics['class_count_diff'] = class_match.group(1).strip()
+    remaining = len(DIFFUSE_METRIC_KEYS)
+    for match in DIFFUSE_METRICS_RE.finditer(output):
+        key = DIFFUSE_METRIC_KEYS[match.lastgroup]
+        if metrics[key] is None:
+            metrics[key] = match.group(match.lastgroup).strip()
+            remaining -= 1
+            if not remaining:
+                break
     
     return metrics
 
 
-def generate_slim_report(full_report_content: str) -> str:
+def write_if_changed(path: Path, content: str) -> bool:
     """
-    Generate slim version of diffuse report by removing DEX section.
+    Write text as UTF-8 unless the file already holds exactly that content.
     
-    Keeps everything before the DEX section, which includes:
-    - APK size summary table
-    - ARSC metrics
-    - Manifest changes
+    Leaving unchanged reports untouched keeps their mtimes and avoids rewriting
+    every saved comparison on each run. Returns whether the file was written.
     """
-    lines = full_report_content.split('\n')
-    slim_lines = []
-    
-    for line in lines:
-        # Stop when we hit the DEX section header
-        if line.strip().startswith('====   DEX   ===='):
-            break
-        slim_lines.append(line)
-    
-    return '\n'.join(slim_lines)
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
 
 
 def generate_trend_report(releases: List[Dict], comparisons: List[Tuple[Dict, Dict, str, Dict]]):
@@ -220,78 +486,95 @@ def generate_trend_report(releases: List[Dict], comparisons: List[Tuple[Dict, Di
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Save individual comparison reports (full and slim versions)
-    for old_release, new_release, diff_output, metrics in comparisons:
+    # Report file names, built once and shared by the files and the markdown links
+    report_names = [get_report_name(old_release, new_release) for old_release, new_release, _, _ in comparisons]
+    
+    # Save individual comparison reports (full and slim versions), each with a single write
+    for (old_release, new_release, diff_output, metrics), report_name in zip(comparisons, report_names):
+        header = get_report_header(old_release, new_release)
+        full_report = header + diff_output
+        
         # Save full report
-        report_file = OUTPUT_DIR / f"{old_release['tag']}_to_{new_release['tag']}.txt"
-        with open(report_file, 'w') as f:
-            f.write(f"Diffuse Comparison: {old_release['tag']} → {new_release['tag']}\n")
-            f.write(f"{'=' * 80}\n\n")
-            f.write(diff_output)
-        log_success(f"Saved comparison: {report_file.name}")
+        report_file = OUTPUT_DIR / f"{report_name}.txt"
+        if write_if_changed(report_file, full_report):
+            log_success(f"Saved comparison: {report_file.name}")
+        else:
+            log_info(f"Comparison unchanged: {report_file.name}")
+        
+        # Save slim report: the APK size summary, ARSC metrics and manifest
+        # changes, cut at the start of the DEX section header's line. The
+        # marker is searched for once, in the Diffuse output only.
+        dex_start = diff_output.find(DEX_SECTION_MARKER)
+        if dex_start < 0:
+            slim_report = full_report
+        else:
+            line_start = diff_output.rfind('\n', 0, dex_start)
+            slim_report = header + diff_output[:line_start] if line_start >= 0 else header[:-1]
+        slim_report_file = OUTPUT_DIR / f"{report_name}-slim.txt"
+        if write_if_changed(slim_report_file, slim_report):
+            log_success(f"Saved slim version: {slim_report_file.name}")
+        else:
+            log_info(f"Slim version unchanged: {slim_report_file.name}")
+    
+    # Generate markdown report, collected in parts and written once
+    parts = [
+        "# APK Size Trend Report\n\n",
+        "This report shows the APK size evolution across releases using [Diffuse](https://github.com/JakeWharton/diffuse).\n\n",
+        f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"**Repository**: `{GITHUB_REPO}`\n\n",
+        f"**Releases Analyzed**: {len(releases)}\n\n",
+    ]
+    
+    # Summary table
+    parts.append("## Release History\n\n")
+    parts.append("| Version | Release Date | APK Size |\n")
+    parts.append("|---------|--------------|----------|\n")
+    for release in releases:
+        size_mb = release['apk_size_mb']
+        # published_at is ISO 8601 ("2025-10-03T15:13:03Z"), so the date is its first 10 characters
+        date = release['published_at'][:10]
+        parts.append(f"| {release['tag']} | {date} | {size_mb:.2f} MB |\n")
+    
+    # Comparison details
+    parts.append("\n## Size Changes Between Releases\n\n")
+    for (old_release, new_release, diff_output, metrics), report_name in zip(comparisons, report_names):
+        parts.append(f"### {old_release['tag']} → {new_release['tag']}\n\n")
+        
+        # Calculate size change percentage
+        old_size_mb = old_release['apk_size_mb']
+        new_size_mb = new_release['apk_size_mb']
+        size_change_mb = new_size_mb - old_size_mb
+        size_change_pct = (size_change_mb / old_size_mb) * 100 if old_size_mb > 0 else 0
         
-        # Save slim report (without DEX section)
-        slim_report_file = OUTPUT_DIR / f"{old_release['tag']}_to_{new_release['tag']}-slim.txt"
-        full_report = f"Diffuse Comparison: {old_release['tag']} → {new_release['tag']}\n{'=' * 80}\n\n{diff_output}"
-        slim_content = generate_slim_report(full_report)
-        with open(slim_report_file, 'w') as f:
-            f.write(slim_content)
-        log_success(f"Saved slim version: {slim_report_file.name}")
-    
-    # Generate markdown report
-    with open(REPORT_PATH, 'w') as f:
-        f.write("# APK Size Trend Report\n\n")
-        f.write("This report shows the APK size evolution across releases using [Diffuse](https://github.com/JakeWharton/diffuse).\n\n")
-        f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write(f"**Repository**: `{GITHUB_REPO}`\n\n")
-        f.write(f"**Releases Analyzed**: {len(releases)}\n\n")
+        change_emoji = "📈" if size_change_mb > 0 else "📉" if size_change_mb < 0 else "➡️"
         
-        # Summary table
-        f.write("## Release History\n\n")
-        f.write("| Version | Release Date | APK Size |\n")
-        f.write("|---------|--------------|----------|\n")
-        for release in releases:
-            size_mb = release['apk_size'] / (1024 * 1024)
-            date = datetime.fromisoformat(release['published_at'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-            f.write(f"| {release['tag']} | {date} | {size_mb:.2f} MB |\n")
+        parts.append(f"**APK Size**: {old_size_mb:.2f} MB → {new_size_mb:.2f} MB ")
+        parts.append(f"({change_emoji} {size_change_mb:+.2f} MB, {size_change_pct:+.1f}%)\n\n")
         
-        # Comparison details
-        f.write("\n## Size Changes Between Releases\n\n")
-        for old_release, new_release, diff_output, metrics in comparisons:
-            f.write(f"### {old_release['tag']} → {new_release['tag']}\n\n")
-            
-            # Calculate size change percentage
-            old_size_mb = old_release['apk_size'] / (1024 * 1024)
-            new_size_mb = new_release['apk_size'] / (1024 * 1024)
-            size_change_mb = new_size_mb - old_size_mb
-            size_change_pct = (size_change_mb / old_size_mb) * 100 if old_size_mb > 0 else 0
-            
-            change_emoji = "📈" if size_change_mb > 0 else "📉" if size_change_mb < 0 else "➡️"
-            
-            f.write(f"**APK Size**: {old_size_mb:.2f} MB → {new_size_mb:.2f} MB ")
-            f.write(f"({change_emoji} {size_change_mb:+.2f} MB, {size_change_pct:+.1f}%)\n\n")
-            
-            # Key metrics
-            if metrics['method_count_diff']:
-                f.write(f"**Method Count Change**: {metrics['method_count_diff']}\n\n")
-            if metrics['class_count_diff']:
-                f.write(f"**Class Count Change**: {metrics['class_count_diff']}\n\n")
-            
-            # Link to detailed report
-            report_file = f"apk-diffs/{old_release['tag']}_to_{new_release['tag']}.txt"
-            f.write(f"[View detailed Diffuse report]({report_file})\n\n")
-            f.write("---\n\n")
+        # Key metrics
+        if metrics['method_count_diff']:
+            parts.append(f"**Method Count Change**: {metrics['method_count_diff']}\n\n")
+        if metrics['class_count_diff']:
+            parts.append(f"**Class Count Change**: {metrics['class_count_diff']}\n\n")
         
-        # Footer
-        f.write("\n## Notes\n\n")
-        f.write("- All comparisons use release APKs (signed, production builds)\n")
-        f.write("- Size measurements are for the compressed APK file\n")
-        f.write("- Method and class counts reflect DEX file contents\n")
-        f.write("- Detailed Diffuse reports available in `docs/apk-diffs/`\n")
-        f.write("\n## Regenerating This Report\n\n")
-        f.write("```bash\n")
-        f.write("python3 scripts/generate_apk_trend_report.py\n")
-        f.write("```\n")
+        # Link to detailed report
+        parts.append(f"[View detailed Diffuse report](apk-diffs/{report_name}.txt)\n\n")
+        parts.append("---\n\n")
+    
+    # Footer
+    parts.append(
+        "\n## Notes\n\n"
+        "- All comparisons use release APKs (signed, production builds)\n"
+        "- Size measurements are for the compressed APK file\n"
+        "- Method and class counts reflect DEX file contents\n"
+        "- Detailed Diffuse reports available in `docs/apk-diffs/`\n"
+        "\n## Regenerating This Report\n\n"
+        "```bash\n"
+        "python3 scripts/generate_apk_trend_report.py\n"
+        "```\n"
+    )
+    
+    REPORT_PATH.write_text(''.join(parts), encoding='utf-8')
     
     log_success(f"Trend report saved to {REPORT_PATH}")
 
@@ -317,29 +600,29 @@ def main():
         log_error("Need at least 2 releases with APKs to generate trend report")
         return 1
     
-    # Download all APKs
-    apk_paths = {}
-    for release in releases:
-        try:
-            apk_path = download_apk(release, WORK_DIR)
-            apk_paths[release['tag']] = apk_path
-        except Exception as e:
-            log_error(f"Failed to download APK for {release['tag']}: {e}")
-            return 1
+    # Reuse comparison reports already saved in OUTPUT_DIR; only the
+    # remaining consecutive release pairs need Diffuse
+    release_pairs = list(zip(releases, releases[1:]))
+    saved_outputs = [load_saved_comparison(old_release, new_release) for old_release, new_release in release_pairs]
+    pending_pairs = [pair for pair, saved_output in zip(release_pairs, saved_outputs) if saved_output is None]
+    if len(pending_pairs) < len(release_pairs):
+        log_info(f"Reusing {len(release_pairs) - len(pending_pairs)} saved comparison report(s) from {OUTPUT_DIR}")
+    
+    # Download only the APKs those comparisons need
+    pending_releases = list({release['tag']: release for pair in pending_pairs for release in pair}.values())
+    try:
+        apk_paths = download_apks(pending_releases, WORK_DIR)
+    except Exception as e:
+        log_error(str(e))
+        return 1
     
     # Run comparisons between consecutive releases
+    pending_outputs = iter(run_diffuse_comparisons(diffuse_bin, pending_pairs, apk_paths))
     comparisons = []
-    for i in range(len(releases) - 1):
-        old_release = releases[i]
-        new_release = releases[i + 1]
-        
-        old_apk = apk_paths[old_release['tag']]
-        new_apk = apk_paths[new_release['tag']]
-        
-        diff_output = run_diffuse_comparison(diffuse_bin, old_apk, new_apk)
-        metrics = parse_diffuse_output(diff_output)
-        
-        comparisons.append((old_release, new_release, diff_output, metrics))
+    for (old_release, new_release), diff_output in zip(release_pairs, saved_outputs):
+        if diff_output is None:
+            diff_output = next(pending_outputs)
+        comparisons.append((old_release, new_release, diff_output, parse_diffuse_output(diff_output)))
     
     # Generate report
     generate_trend_report(releases, comparisons)
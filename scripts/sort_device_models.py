@@ -10,8 +10,33 @@ Usage:
 """
 
 import json
+import os
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster parsing and serialization
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    """Read a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump_json(data):
+    """Serialize to 2-space indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        # Same bytes as json.dumps(indent=2, ensure_ascii=False) as long as no
+        # float needs exponent notation; orjson writes those differently
+        # ("1e20" rather than "1e+20")
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 def sort_device_models():
     """Sort device models in device-models.json by name."""
@@ -28,8 +53,7 @@ def sort_device_models():
     print(f"📖 Reading {device_models_path.relative_to(project_root)}")
 
     # Read the JSON file
-    with open(device_models_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(device_models_path)
 
     # Get original count and first/last devices
     original_count = len(data["data"])
@@ -40,7 +64,7 @@ def sort_device_models():
     print(f"   Current order: {original_first} ... {original_last}")
 
     # Sort the data array by 'name' field
-    data["data"].sort(key=lambda device: device["name"])
+    data["data"].sort(key=itemgetter("name"))
 
     # Get new first/last devices after sorting
     sorted_first = data["data"][0]["name"] if data["data"] else None
@@ -48,10 +72,17 @@ def sort_device_models():
 
     print(f"   Sorted order:  {sorted_first} ... {sorted_last}")
 
-    # Write the sorted data back to the file
-    with open(device_models_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")  # Add trailing newline
+    # Write the sorted data back to the file. Safe save: write a temporary file
+    # and atomically swap it in, so an interrupted run never leaves a truncated
+    # device-models.json behind.
+    tmp_path = device_models_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(dump_json(data))
+        os.replace(tmp_path, device_models_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
 
     print(f"✅ Successfully sorted and saved {device_models_path.relative_to(project_root)}")
     return 0